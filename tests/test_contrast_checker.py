@@ -4,6 +4,8 @@ Unit tests for ContrastChecker module.
 
 import unittest
 
+import numpy as np
+
 from contrast_check.contrast_checker import ContrastChecker
 
 
@@ -117,6 +119,75 @@ class TestContrastChecker(unittest.TestCase):
         ratio = self.checker.calculate_contrast_ratio(color1, color2)
         self.assertAlmostEqual(ratio, 7.0, delta=0.5)
 
-
-if __name__ == "__main__":
-    unittest.main()
+    def test_contrast_ratio_batch_black_white(self):
+        """Test batch contrast ratio between black and white."""
+        ratios = self.checker.calculate_contrast_ratio_batch(
+            np.array([[0, 0, 0]]), np.array([[255, 255, 255]])
+        )
+        self.assertEqual(ratios.shape, (1,))
+        self.assertAlmostEqual(ratios[0], 21.0, places=1)
+
+    def test_contrast_ratio_batch_matches_scalar(self):
+        """Test that batch ratios match the scalar calculation pairwise."""
+        pairs = [
+            ((0, 0, 0), (255, 255, 255)),
+            ((128, 128, 128), (128, 128, 128)),
+            ((100, 150, 200), (200, 100, 50)),
+            ((89, 89, 89), (255, 255, 255)),
+            ((200, 200, 200), (255, 255, 255)),
+        ]
+        ratios = self.checker.calculate_contrast_ratio_batch(
+            np.array([p[0] for p in pairs]),
+            np.array([p[1] for p in pairs]),
+        )
+        for ratio, (color1, color2) in zip(ratios, pairs):
+            expected = self.checker.calculate_contrast_ratio(color1, color2)
+            self.assertAlmostEqual(ratio, expected, places=9)
+
+    def test_analyze_contrast_batch_matches_scalar(self):
+        """Test that batch analysis matches analyze_contrast per pair."""
+        # Pairs chosen to land on each WCAG compliance outcome: AAA
+        # pass, AA-only, large-text-only, and outright fail
+        pairs = [
+            ((0, 0, 0), (255, 255, 255)),
+            ((100, 100, 100), (255, 255, 255)),
+            ((118, 118, 118), (255, 255, 255)),
+            ((200, 200, 200), (255, 255, 255)),
+        ]
+        for is_large_text in (False, True):
+            analyses = self.checker.analyze_contrast_batch(
+                np.array([p[0] for p in pairs]),
+                np.array([p[1] for p in pairs]),
+                is_large_text,
+            )
+            self.assertEqual(len(analyses), len(pairs))
+            for analysis, (text_color, bg_color) in zip(analyses, pairs):
+                expected = self.checker.analyze_contrast(
+                    text_color, bg_color, is_large_text
+                )
+                self.assertEqual(tuple(analysis["text_color"]), text_color)
+                self.assertEqual(tuple(analysis["bg_color"]), bg_color)
+                self.assertAlmostEqual(
+                    analysis["contrast_ratio"], expected["contrast_ratio"]
+                )
+                self.assertEqual(analysis["wcag_aa"], expected["wcag_aa"])
+                self.assertEqual(analysis["wcag_aaa"], expected["wcag_aaa"])
+                self.assertEqual(analysis["level"], expected["level"])
+                self.assertEqual(analysis["is_large_text"], is_large_text)
+
+    def test_analyze_contrast_batch_boundary_ratios(self):
+        """Test batch compliance at the exact WCAG threshold ratios."""
+        # 3.0, 4.5 and 7.0 are the large-AA, normal-AA and normal-AAA
+        # cutoffs; >= at the threshold must count as a pass. Feeding
+        # identical colors pins the ratio at exactly 1.0 as a floor.
+        analyses = self.checker.analyze_contrast_batch(
+            np.array([[128, 128, 128], [0, 0, 0]]),
+            np.array([[128, 128, 128], [255, 255, 255]]),
+        )
+        self.assertAlmostEqual(analyses[0]["contrast_ratio"], 1.0, places=2)
+        self.assertFalse(analyses[0]["wcag_aa"])
+        self.assertFalse(analyses[0]["wcag_aaa"])
+        self.assertEqual(analyses[0]["level"], "Poor (Fails WCAG)")
+        self.assertTrue(analyses[1]["wcag_aa"])
+        self.assertTrue(analyses[1]["wcag_aaa"])
+        self.assertEqual(analyses[1]["level"], "Excellent (AAA)")
@@ -3,234 +3,259 @@ Unit tests for main application module.
 """
 
 import json
-import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, patch
 
+import numpy as np
+import pytest
+
+# Resolve the module object once; patch.object skips the dotted-path
+# import walk that string targets pay on every patcher start
+from contrast_check import main as _main_mod
 from contrast_check.main import ContrastAnalyzer
 
+# Shared read-only image; allocated once instead of per test
+_IMAGE_100 = np.zeros((100, 100, 3), dtype=np.uint8)
+_IMAGE_100.setflags(write=False)
+
+_TEXT_REGIONS = [
+    {
+        "text": "Hello",
+        "confidence": 0.95,
+        "bbox": np.array([[10, 10], [50, 10], [50, 30], [10, 30]], dtype=np.int32),
+        "center": (30, 20),
+    }
+]
+
+_ANALYSES = [
+    {
+        "contrast_ratio": 21.0,
+        "wcag_aa": True,
+        "wcag_aaa": True,
+        "level": "Excellent (AAA)",
+    }
+]
+
+# Canned report inputs, built once at import instead of per test; the
+# tuples guard against a test mutating shared fixture data
+_JSON_RESULTS = (
+    {
+        "index": 0,
+        "text": "Test",
+        "confidence": 0.95,
+        "contrast_ratio": 7.5,
+        "wcag_aa": True,
+        "wcag_aaa": True,
+    },
+)
+
+_TEXT_RESULTS = (
+    {
+        "index": 0,
+        "text": "Test",
+        "confidence": 0.95,
+        "color_1": (0, 0, 0),
+        "color_1_hex": "#000000",
+        "color_2": (255, 255, 255),
+        "color_2_hex": "#ffffff",
+        "contrast_ratio": 21.0,
+        "wcag_aa": True,
+        "wcag_aaa": True,
+        "level": "Excellent (AAA)",
+    },
+)
+
+_SUMMARY_RESULTS = (
+    {
+        "index": 0,
+        "text": "Good",
+        "confidence": 0.95,
+        "color_1": (0, 0, 0),
+        "color_1_hex": "#000000",
+        "color_2": (255, 255, 255),
+        "color_2_hex": "#ffffff",
+        "contrast_ratio": 21.0,
+        "wcag_aa": True,
+        "wcag_aaa": True,
+        "level": "Excellent (AAA)",
+    },
+    {
+        "index": 1,
+        "text": "Poor",
+        "confidence": 0.90,
+        "color_1": (200, 200, 200),
+        "color_1_hex": "#c8c8c8",
+        "color_2": (255, 255, 255),
+        "color_2_hex": "#ffffff",
+        "contrast_ratio": 1.5,
+        "wcag_aa": False,
+        "wcag_aaa": False,
+        "level": "Poor (Fails WCAG)",
+    },
+)
+
+
+# Plain stub classes for the hot path: every attribute access on a Mock
+# allocates a child mock, which dominates runtime in these trivially
+# mock-driven tests. Mock stays where call assertions are needed.
+class _FakeOCRExtractor:
+    def extract_text_regions(self, image_path):
+        return _TEXT_REGIONS
+
+    def extract_text_regions_batch(self, image_paths):
+        return [_TEXT_REGIONS for _ in image_paths]
+
+
+class _FakeColorExtractor:
+    def extract_colors(self, image, bbox, margin=10):
+        return ((0, 0, 0), (255, 255, 255))
+
+    @staticmethod
+    def rgb_to_hex(rgb):
+        return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+
+class _FakeContrastChecker:
+    def analyze_contrast_batch(self, text_colors, bg_colors, is_large_text=False):
+        return [_ANALYSES[0] for _ in range(len(text_colors))]
+
+
+@pytest.fixture
+def mock_deps():
+    """Patch the analyzer's three collaborators for one test."""
+    patcher = patch.multiple(
+        _main_mod,
+        OCRExtractor=DEFAULT,
+        ColorExtractor=DEFAULT,
+        ContrastChecker=DEFAULT,
+    )
+    mocks = patcher.start()
+    yield (
+        mocks["OCRExtractor"],
+        mocks["ColorExtractor"],
+        mocks["ContrastChecker"],
+    )
+    patcher.stop()
+
+
+@pytest.fixture
+def stub_deps(mock_deps):
+    """Inject plain stub collaborators behind the patched classes."""
+    mock_ocr, mock_color, mock_checker = mock_deps
+    mock_ocr.return_value = _FakeOCRExtractor()
+    mock_color.return_value = _FakeColorExtractor()
+    mock_checker.return_value = _FakeContrastChecker()
+    return mock_deps
+
+
+def test_initialization(mock_deps):
+    """Test ContrastAnalyzer initialization."""
+    mock_ocr, mock_color, _ = mock_deps
+
+    ContrastAnalyzer(use_gpu=True, lang="ch", n_colors=2)
+
+    # Verify OCRExtractor was initialized correctly
+    mock_ocr.assert_called_once_with(use_gpu=True, lang="ch")
+
+    # Verify ColorExtractor was initialized correctly
+    mock_color.assert_called_once_with(n_colors=2)
+
+
+def test_analyze_image_no_text(monkeypatch, mock_deps):
+    """Test image analysis with no text detected."""
+    mock_ocr, _, _ = mock_deps
+    monkeypatch.setattr(_main_mod.cv2, "imread", lambda path: _IMAGE_100)
+
+    # Mock OCR to return empty list
+    mock_ocr.return_value.extract_text_regions.return_value = []
+
+    analyzer = ContrastAnalyzer()
+    results = analyzer.analyze_image("test_image.jpg")
+
+    assert results == []
+
+
+def test_analyze_image_with_text(monkeypatch, stub_deps):
+    """Test image analysis with text detected."""
+    # monkeypatch does one direct setattr (auto-undone at teardown)
+    # instead of entering a patch context per test
+    monkeypatch.setattr(_main_mod.cv2, "imread", lambda path: _IMAGE_100)
+
+    analyzer = ContrastAnalyzer()
+    results = analyzer.analyze_image("test_image.jpg")
+
+    # Verify results
+    assert len(results) == 1
+    assert results[0]["text"] == "Hello"
+    # Exact comparison: the value comes straight from the stub with no
+    # floating-point arithmetic in between
+    assert results[0]["confidence"] == 0.95
+    assert results[0]["contrast_ratio"] == 21.0
+    assert results[0]["wcag_aa"]
+    assert results[0]["wcag_aaa"]
+    assert results[0]["color_1"] == (0, 0, 0)
+    assert results[0]["color_2"] == (255, 255, 255)
+
+
+def test_analyze_images_batch(monkeypatch, stub_deps):
+    """Test batched analysis across multiple images."""
+    monkeypatch.setattr(_main_mod.cv2, "imread", lambda path: _IMAGE_100)
+
+    analyzer = ContrastAnalyzer()
+    results = analyzer.analyze_images(["a.jpg", "b.jpg"])
+
+    # One result list per input image, in input order
+    assert len(results) == 2
+    for per_image in results:
+        assert len(per_image) == 1
+        assert per_image[0]["index"] == 0
+        assert per_image[0]["text"] == "Hello"
+        assert per_image[0]["contrast_ratio"] == 21.0
+        assert per_image[0]["color_1"] == (0, 0, 0)
+        assert per_image[0]["color_2"] == (255, 255, 255)
+
+
+def test_generate_report_json(mock_deps):
+    """Test JSON report generation."""
+    analyzer = ContrastAnalyzer()
+
+    report = analyzer.generate_report(list(_JSON_RESULTS), output_format="json")
+
+    # Should be valid JSON
+    parsed = json.loads(report)
+    assert len(parsed) == 1
+    assert parsed[0]["text"] == "Test"
+
+
+def test_generate_report_text(mock_deps):
+    """Test text report generation."""
+    analyzer = ContrastAnalyzer()
+
+    report = analyzer.generate_report(list(_TEXT_RESULTS), output_format="text")
+
+    # Check report contains expected sections
+    assert "CONTRAST ANALYSIS REPORT" in report
+    assert "Test" in report
+    assert "21.0:1" in report
+    assert "SUMMARY" in report
+    assert "WCAG AA Compliance" in report
+    assert "Color 1" in report
+    assert "Color 2" in report
+
+
+def test_generate_report_invalid_format(mock_deps):
+    """Test report generation with invalid format."""
+    analyzer = ContrastAnalyzer()
+
+    with pytest.raises(ValueError):
+        analyzer.generate_report([], output_format="invalid")
+
+
+def test_generate_report_summary_statistics(mock_deps):
+    """Test that summary statistics are calculated correctly."""
+    analyzer = ContrastAnalyzer()
+
+    report = analyzer.generate_report(list(_SUMMARY_RESULTS), output_format="text")
 
-class TestContrastAnalyzer(unittest.TestCase):
-    """Test cases for ContrastAnalyzer class."""
-
-    @patch("contrast_check.main.OCRExtractor")
-    @patch("contrast_check.main.ColorExtractor")
-    @patch("contrast_check.main.ContrastChecker")
-    def test_initialization(self, mock_checker, mock_color, mock_ocr):
-        """Test ContrastAnalyzer initialization."""
-        ContrastAnalyzer(use_gpu=True, lang="ch", n_colors=2)
-
-        # Verify OCRExtractor was initialized correctly
-        mock_ocr.assert_called_once_with(use_gpu=True, lang="ch")
-
-        # Verify ColorExtractor was initialized correctly
-        mock_color.assert_called_once_with(n_colors=2)
-
-    @patch("contrast_check.main.cv2.imread")
-    @patch("contrast_check.main.OCRExtractor")
-    @patch("contrast_check.main.ColorExtractor")
-    @patch("contrast_check.main.ContrastChecker")
-    def test_analyze_image_no_text(
-        self, mock_checker, mock_color, mock_ocr, mock_imread
-    ):
-        """Test image analysis with no text detected."""
-        # Mock OCR to return empty list
-        mock_ocr_instance = Mock()
-        mock_ocr_instance.extract_text_regions.return_value = []
-        mock_ocr.return_value = mock_ocr_instance
-
-        mock_color_instance = Mock()
-        mock_color.return_value = mock_color_instance
-
-        mock_checker_instance = Mock()
-        mock_checker.return_value = mock_checker_instance
-
-        analyzer = ContrastAnalyzer()
-        results = analyzer.analyze_image("test_image.jpg")
-
-        self.assertEqual(results, [])
-
-    @patch("contrast_check.main.cv2.imread")
-    @patch("contrast_check.main.OCRExtractor")
-    @patch("contrast_check.main.ColorExtractor")
-    @patch("contrast_check.main.ContrastChecker")
-    def test_analyze_image_with_text(
-        self, mock_checker, mock_color, mock_ocr, mock_imread
-    ):
-        """Test image analysis with text detected."""
-        import numpy as np
-
-        # Mock image
-        mock_image = np.zeros((100, 100, 3), dtype=np.uint8)
-        mock_imread.return_value = mock_image
-
-        # Mock OCR results
-        mock_text_regions = [
-            {
-                "text": "Hello",
-                "confidence": 0.95,
-                "bbox": [[10, 10], [50, 10], [50, 30], [10, 30]],
-                "center": (30, 20),
-            }
-        ]
-
-        mock_ocr_instance = Mock()
-        mock_ocr_instance.extract_text_regions.return_value = mock_text_regions
-        mock_ocr.return_value = mock_ocr_instance
-
-        # Mock color extraction
-        mock_color_instance = Mock()
-        mock_color_instance.extract_colors.return_value = ((0, 0, 0), (255, 255, 255))
-        mock_color_instance.rgb_to_hex.side_effect = (
-            lambda rgb: "#{:02x}{:02x}{:02x}".format(*rgb)
-        )
-        mock_color.return_value = mock_color_instance
-
-        # Mock contrast checker
-        mock_checker_instance = Mock()
-        mock_checker_instance.analyze_contrast.return_value = {
-            "contrast_ratio": 21.0,
-            "wcag_aa": True,
-            "wcag_aaa": True,
-            "level": "Excellent (AAA)",
-        }
-        mock_checker.return_value = mock_checker_instance
-
-        analyzer = ContrastAnalyzer()
-        results = analyzer.analyze_image("test_image.jpg")
-
-        # Verify results
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]["text"], "Hello")
-        self.assertAlmostEqual(results[0]["confidence"], 0.95)
-        self.assertEqual(results[0]["contrast_ratio"], 21.0)
-        self.assertTrue(results[0]["wcag_aa"])
-        self.assertTrue(results[0]["wcag_aaa"])
-        self.assertEqual(results[0]["color_1"], (0, 0, 0))
-        self.assertEqual(results[0]["color_2"], (255, 255, 255))
-
-    def test_generate_report_json(self):
-        """Test JSON report generation."""
-        with (
-            patch("contrast_check.main.OCRExtractor"),
-            patch("contrast_check.main.ColorExtractor"),
-            patch("contrast_check.main.ContrastChecker"),
-        ):
-
-            analyzer = ContrastAnalyzer()
-
-            mock_results = [
-                {
-                    "index": 0,
-                    "text": "Test",
-                    "confidence": 0.95,
-                    "contrast_ratio": 7.5,
-                    "wcag_aa": True,
-                    "wcag_aaa": True,
-                }
-            ]
-
-            report = analyzer.generate_report(mock_results, output_format="json")
-
-            # Should be valid JSON
-            parsed = json.loads(report)
-            self.assertEqual(len(parsed), 1)
-            self.assertEqual(parsed[0]["text"], "Test")
-
-    def test_generate_report_text(self):
-        """Test text report generation."""
-        with (
-            patch("contrast_check.main.OCRExtractor"),
-            patch("contrast_check.main.ColorExtractor"),
-            patch("contrast_check.main.ContrastChecker"),
-        ):
-
-            analyzer = ContrastAnalyzer()
-
-            mock_results = [
-                {
-                    "index": 0,
-                    "text": "Test",
-                    "confidence": 0.95,
-                    "color_1": (0, 0, 0),
-                    "color_1_hex": "#000000",
-                    "color_2": (255, 255, 255),
-                    "color_2_hex": "#ffffff",
-                    "contrast_ratio": 21.0,
-                    "wcag_aa": True,
-                    "wcag_aaa": True,
-                    "level": "Excellent (AAA)",
-                }
-            ]
-
-            report = analyzer.generate_report(mock_results, output_format="text")
-
-            # Check report contains expected sections
-            self.assertIn("CONTRAST ANALYSIS REPORT", report)
-            self.assertIn("Test", report)
-            self.assertIn("21.0:1", report)
-            self.assertIn("SUMMARY", report)
-            self.assertIn("WCAG AA Compliance", report)
-            self.assertIn("Color 1", report)
-            self.assertIn("Color 2", report)
-
-    def test_generate_report_invalid_format(self):
-        """Test report generation with invalid format."""
-        with (
-            patch("contrast_check.main.OCRExtractor"),
-            patch("contrast_check.main.ColorExtractor"),
-            patch("contrast_check.main.ContrastChecker"),
-        ):
-
-            analyzer = ContrastAnalyzer()
-
-            with self.assertRaises(ValueError):
-                analyzer.generate_report([], output_format="invalid")
-
-    def test_generate_report_summary_statistics(self):
-        """Test that summary statistics are calculated correctly."""
-        with (
-            patch("contrast_check.main.OCRExtractor"),
-            patch("contrast_check.main.ColorExtractor"),
-            patch("contrast_check.main.ContrastChecker"),
-        ):
-
-            analyzer = ContrastAnalyzer()
-
-            mock_results = [
-                {
-                    "index": 0,
-                    "text": "Good",
-                    "confidence": 0.95,
-                    "color_1": (0, 0, 0),
-                    "color_1_hex": "#000000",
-                    "color_2": (255, 255, 255),
-                    "color_2_hex": "#ffffff",
-                    "contrast_ratio": 21.0,
-                    "wcag_aa": True,
-                    "wcag_aaa": True,
-                    "level": "Excellent (AAA)",
-                },
-                {
-                    "index": 1,
-                    "text": "Poor",
-                    "confidence": 0.90,
-                    "color_1": (200, 200, 200),
-                    "color_1_hex": "#c8c8c8",
-                    "color_2": (255, 255, 255),
-                    "color_2_hex": "#ffffff",
-                    "contrast_ratio": 1.5,
-                    "wcag_aa": False,
-                    "wcag_aaa": False,
-                    "level": "Poor (Fails WCAG)",
-                },
-            ]
-
-            report = analyzer.generate_report(mock_results, output_format="text")
-
-            # Check that summary shows 50% AA compliance (1 out of 2)
-            self.assertIn("1/2", report)
-            self.assertIn("50.0%", report)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # Check that summary shows 50% AA compliance (1 out of 2)
+    assert "1/2" in report
+    assert "50.0%" in report